@@ -8,6 +8,7 @@ from player import Player
 from settings import LAYERS, SCREEN_HEIGHT, SCREEN_WIDTH, TILE_SIZE, PLAYER_TOOL_OFFSET, DEBUG
 from sky import Rain, Sky
 from soil import SoilLayer
+from spatial_hash import SpatialHashGroup
 from sprites import GenericSprite, Water, WildFlower, Tree, Interactable, Particle
 from support import import_images_from_folder
 from transition import Transition
@@ -21,7 +22,7 @@ class Level:
 
         # Sprite groups
         self.all_sprites = CameraGroup()
-        self.collision_sprites = pygame.sprite.Group()
+        self.collision_sprites = SpatialHashGroup()
         self.tree_sprites = pygame.sprite.Group()
         self.interactable_sprites = pygame.sprite.Group()
 
@@ -77,7 +78,8 @@ class Level:
                  surf=obj.image,
                  groups=[self.all_sprites, self.collision_sprites, self.tree_sprites],
                  name=obj.name,
-                 player_add=self.player_add)
+                 player_add=self.player_add,
+                 collision_sprites=self.collision_sprites)
 
         # Collision Tiles
         for x, y, surf in tmx_data.get_layer_by_name('Collision').tiles():
@@ -146,7 +148,7 @@ class Level:
                     col = plant.rect.centerx // TILE_SIZE
                     self.soil_layer.grid[row][col].remove('P')
 
-    def run(self, dt) -> None:
+    def run(self, dt: float, events: list[pygame.event.Event]) -> None:
         # Drawing
         self.display_surface.fill('black')
         self.all_sprites.custom_draw(self.player)
@@ -157,6 +159,7 @@ class Level:
             self.menu.update()
         else:
             self.plant_collision()
+            self.player.handle_events(events)
             self.all_sprites.update(dt)
         
         # Overlay
@@ -197,5 +200,5 @@ class CameraGroup(pygame.sprite.Group):
                         hitbox_rect = player.hitbox.copy()
                         hitbox_rect.center = offset_rect.center
                         pygame.draw.rect(self.display_surface, 'green', hitbox_rect, 5)
-                        target_pos = offset_rect.center + PLAYER_TOOL_OFFSET[player.status.split('_')[0]]
+                        target_pos = offset_rect.center + PLAYER_TOOL_OFFSET[player.direction_name]
                         pygame.draw.circle(self.display_surface, 'blue', target_pos, 5)
@@ -17,13 +17,15 @@ class Game:
 
     def run(self) -> None:
         while True:
-            for event in pygame.event.get():
+            # Drain the queue once per frame and hand the events on for discrete key presses
+            events = pygame.event.get()
+            for event in events:
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit(0)
 
             dt = self.clock.tick() / 1000
-            self.level.run(dt)
+            self.level.run(dt, events)
             pygame.display.update()
 
 
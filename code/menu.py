@@ -1,5 +1,5 @@
 import pygame
-from player import Player
+from player import Player, Seed
 from typing import Callable
 from settings import SCREEN_HEIGHT, SCREEN_WIDTH, SALE_PRICES, PURCHASE_PRICES
 from timer import Timer
@@ -11,7 +11,7 @@ class Menu:
         self.display_surface = pygame.display.get_surface()
         self.font = pygame.font.Font('../font/LycheeSoda.ttf', 30)
 
-        self.options = list(self.player.item_inventory.keys()) + list(self.player.seed_inventory.keys())
+        self.options = list(self.player.item_inventory.keys()) + self.player.seeds
         self.sell_border = len(self.player.item_inventory) -1
         self.text_surfs = self.setup_text_surfs()
 
@@ -80,7 +80,7 @@ class Menu:
                 else:
                     seed_price = PURCHASE_PRICES[current_item]
                     if self.player.money >= seed_price:
-                        self.player.seed_inventory[current_item] += 1
+                        self.player.seed_inventory[Seed[current_item.upper()]] += 1
                         self.player.money -= seed_price
 
     def show_entry(self, text_surf: pygame.Surface, top: int, amount: int, selected: bool) -> None:
@@ -108,7 +108,7 @@ class Menu:
         self.display_money()
         for index, text_surf in enumerate(self.text_surfs):
             top = self.main_rect.top + index * (text_surf.get_height() + (self.padding * 2) + self.space)
-            amount_list = list(self.player.item_inventory.values()) + list(self.player.seed_inventory.values())
+            amount_list = list(self.player.item_inventory.values()) + self.player.seed_inventory
             amount = amount_list[index]
             self.show_entry(text_surf=text_surf, top=top, amount=amount, selected=self.index==index)
             
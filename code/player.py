@@ -1,31 +1,75 @@
+import math
+from enum import IntEnum
+
 import pygame
+from pygame import K_UP, K_DOWN, K_LEFT, K_RIGHT, K_SPACE, K_q, K_w, K_LCTRL, K_RETURN, KEYDOWN
+from pygame.math import Vector2
 
 from settings import LAYERS, PLAYER_TOOL_OFFSET
 from soil import SoilLayer
-from support import import_images_from_folder, increment_and_modulo
+from spatial_hash import SpatialHashGroup
+from support import import_images_from_folder
 from timer import Timer
-from typing import Callable
+from typing import Callable, Optional
+
+
+class Status(IntEnum):
+    UP = 0
+    DOWN = 1
+    LEFT = 2
+    RIGHT = 3
+    RIGHT_IDLE = 4
+    LEFT_IDLE = 5
+    UP_IDLE = 6
+    DOWN_IDLE = 7
+    RIGHT_HOE = 8
+    LEFT_HOE = 9
+    UP_HOE = 10
+    DOWN_HOE = 11
+    RIGHT_AXE = 12
+    LEFT_AXE = 13
+    UP_AXE = 14
+    DOWN_AXE = 15
+    RIGHT_WATER = 16
+    LEFT_WATER = 17
+    UP_WATER = 18
+    DOWN_WATER = 19
+
+
+class Seed(IntEnum):
+    CORN = 0
+    TOMATO = 1
+
+
+# Lookup tables so set_status never has to build status names at runtime
+IDLE_STATUS = {direction: Status[direction.upper() + '_IDLE'] for direction in PLAYER_TOOL_OFFSET}
+TOOL_STATUS = {tool: {direction: Status[(direction + '_' + tool).upper()] for direction in PLAYER_TOOL_OFFSET}
+               for tool in ('hoe', 'axe', 'water')}
 
 
 class Player(pygame.sprite.Sprite):
-    def __init__(self, pos: tuple[int, int], group: pygame.sprite.Group, collision_sprites: pygame.sprite.Group,
+    _animation_frames_cache: Optional[list[tuple[pygame.Surface, ...]]] = None
+    _water_sound: Optional[pygame.mixer.Sound] = None
+
+    def __init__(self, pos: tuple[int, int], group: pygame.sprite.Group, collision_sprites: SpatialHashGroup,
                  tree_sprites: pygame.sprite.Group, interactable_sprites: pygame.sprite.Group, soil_layer: SoilLayer,
                  toggle_shop: Callable):
         super().__init__(group)
 
         # Animation setup
-        self.animations = self.import_assets()
-        self.status = 'down_idle'
+        self.animation_frames = Player.import_assets()
+        self.status = Status.DOWN_IDLE
+        self.direction_name = 'down'
         self.frame_index = 0
 
         # General setup
-        self.image = self.animations[self.status][self.frame_index]
+        self.image = self.animation_frames[self.status][self.frame_index]
         self.rect = self.image.get_rect(center=pos)
         self.z = LAYERS['main']
 
         # Movement attributes
-        self.direction = pygame.math.Vector2(0, 0)
-        self.pos = pygame.math.Vector2(self.rect.center)
+        self.direction = Vector2(0, 0)
+        self.pos = Vector2(self.rect.center)
         self.speed = 250
 
         # Collision
@@ -35,19 +79,18 @@ class Player(pygame.sprite.Sprite):
         # Timers
         self.timers = {
             'tool use': Timer(350, self.use_tool),
-            'tool switch': Timer(200),
             'seed use': Timer(350, self.use_seed),
-            'seed switch': Timer(200),
         }
+        self.all_timers = tuple(self.timers.values())
 
         # Tools
         self.tools = ['hoe', 'axe', 'water']
         self.tool_index = 0
         self.selected_tool = self.tools[self.tool_index]
-        self.target_pos = self.rect.center + PLAYER_TOOL_OFFSET[self.status.split('_')[0]]
+        self.target_pos = self.rect.center + PLAYER_TOOL_OFFSET[self.direction_name]
 
         # Seeds
-        self.seeds = ['corn', 'tomato']
+        self.seeds = [seed.name.lower() for seed in Seed]
         self.seed_index = 0
         self.selected_seed = self.seeds[self.seed_index]
 
@@ -58,10 +101,8 @@ class Player(pygame.sprite.Sprite):
             'corn':   0,
             'tomato': 0,
         }
-        self.seed_inventory = {
-            'corn': 5,
-            'tomato': 5,
-        }
+        # Indexed by Seed, which matches seed_index
+        self.seed_inventory = [5, 5]
         self.money = 200
 
         # Interactables
@@ -71,157 +112,198 @@ class Player(pygame.sprite.Sprite):
         self.soil_layer = soil_layer
         self.toggle_shop = toggle_shop
 
-        self.water_sound = pygame.mixer.Sound('../audio/water.mp3')
-        self.water_sound.set_volume(0.01)
+        # Decoded once and shared, recreating the player shouldn't reload the mp3
+        if Player._water_sound is None:
+            Player._water_sound = pygame.mixer.Sound('../audio/water.mp3')
+            Player._water_sound.set_volume(0.01)
+        self.water_sound = Player._water_sound
 
     def use_tool(self) -> None:
+        self.set_target_pos()
         if self.selected_tool == 'hoe':
             self.soil_layer.get_hit(self.target_pos)
         if self.selected_tool == 'axe':
-            for tree in self.tree_sprites.sprites():
-                if tree.rect.collidepoint(self.target_pos):
-                    tree.damage()
+            # Sprites count as rect-like through their rect attribute, so the whole scan runs in C
+            trees = self.tree_sprites.sprites()
+            target_rect = pygame.Rect(self.target_pos, (1, 1))
+            for index in target_rect.collidelistall(trees):
+                trees[index].damage()
         if self.selected_tool == 'water':
             self.water_sound.play()
             self.soil_layer.water(self.target_pos)
 
     def use_seed(self) -> None:
-        if self.seed_inventory[self.selected_seed] > 0:
+        self.set_target_pos()
+        if self.seed_inventory[self.seed_index] > 0:
             self.soil_layer.plant_seed(self.target_pos, self.selected_seed)
-            self.seed_inventory[self.selected_seed] -= 1
+            self.seed_inventory[self.seed_index] -= 1
 
     def set_target_pos(self) -> None:
-        self.target_pos = self.rect.center + PLAYER_TOOL_OFFSET[self.status.split('_')[0]]
-
-    @staticmethod
-    def import_assets() -> dict[str: list[pygame.Surface]]:
-        animations = {'up': [], 'down': [], 'left': [], 'right': [],
-                      'right_idle': [], 'left_idle': [], 'up_idle': [], 'down_idle': [],
-                      'right_hoe': [], 'left_hoe': [], 'up_hoe': [], 'down_hoe': [],
-                      'right_axe': [], 'left_axe': [], 'up_axe': [], 'down_axe': [],
-                      'right_water': [], 'left_water': [], 'up_water': [], 'down_water': []}
-
-        for animation in animations:
-            full_path = '../graphics/character/' + animation
-            animations[animation] = import_images_from_folder(full_path)
-        return animations
+        self.target_pos = self.rect.center + PLAYER_TOOL_OFFSET[self.direction_name]
+
+    @classmethod
+    def import_assets(cls) -> list[tuple[pygame.Surface, ...]]:
+        # Surfaces are only ever read, so every Player can share one set
+        if cls._animation_frames_cache is not None:
+            return cls._animation_frames_cache
+
+        # Indexed by Status, each status' frames live in the folder of the same name
+        animation_frames = []
+        for status in Status:
+            full_path = '../graphics/character/' + status.name.lower()
+            animation_frames.append(tuple(import_images_from_folder(full_path)))
+        cls._animation_frames_cache = animation_frames
+        return animation_frames
 
     def animate(self, dt: float) -> None:
-        self.frame_index += 4 * dt
-        if self.frame_index >= len(self.animations[self.status]):
-            self.frame_index = 0
-
-        self.image = self.animations[self.status][int(self.frame_index)]
+        frames = self.animation_frames[self.status]
+        self.frame_index = (self.frame_index + 4 * dt) % len(frames)
+        self.image = frames[int(self.frame_index)]
 
     def input(self) -> None:
         keys = pygame.key.get_pressed()
 
         if not self.timers['tool use'].active and not self.sleep:
             # Vertical movement
-            if keys[pygame.K_UP]:
+            if keys[K_UP]:
                 self.direction.y = -1
-                self.status = 'up'
-            elif keys[pygame.K_DOWN]:
+                self.status = Status.UP
+                self.direction_name = 'up'
+            elif keys[K_DOWN]:
                 self.direction.y = 1
-                self.status = 'down'
+                self.status = Status.DOWN
+                self.direction_name = 'down'
             else:
                 self.direction.y = 0
 
             # Horizontal movement
-            if keys[pygame.K_LEFT]:
+            if keys[K_LEFT]:
                 self.direction.x = -1
-                self.status = 'left'
-            elif keys[pygame.K_RIGHT]:
+                self.status = Status.LEFT
+                self.direction_name = 'left'
+            elif keys[K_RIGHT]:
                 self.direction.x = 1
-                self.status = 'right'
+                self.status = Status.RIGHT
+                self.direction_name = 'right'
             else:
                 self.direction.x = 0
 
-            # Tool usage
-            if keys[pygame.K_SPACE]:
-                self.timers['tool use'].activate()
-                self.direction = pygame.math.Vector2()
-                self.frame_index = 0
-
-            # Change tool
-            if keys[pygame.K_q] and not self.timers['tool switch'].active:
-                self.timers['tool switch'].activate()
-                self.tool_index = increment_and_modulo(self.tool_index, len(self.tools))
-                self.selected_tool = self.tools[self.tool_index]
-
-            # Seed usage
-            if keys[pygame.K_LCTRL]:
-                self.timers['seed use'].activate()
-                self.direction = pygame.math.Vector2()
-                self.frame_index = 0
-
-            # Change seed
-            if keys[pygame.K_w] and not self.timers['seed switch'].active:
-                self.timers['seed switch'].activate()
-                self.seed_index = increment_and_modulo(self.seed_index, len(self.seeds))
-                self.selected_seed = self.seeds[self.seed_index]
-
-        if keys[pygame.K_RETURN]:
-            collided_interaction_sprite = pygame.sprite.spritecollide(sprite=self, group=self.interactable_sprites, dokill=False)
-            if collided_interaction_sprite and collided_interaction_sprite[0].name == 'Trader':
-                self.toggle_shop()
-            if collided_interaction_sprite and collided_interaction_sprite[0].name == 'Bed':
-                self.status = 'left_idle'
-                self.sleep = True
+    def handle_events(self, events: list[pygame.event.Event]) -> None:
+        # Discrete actions fire once per key press, so they don't need debounce timers
+        for event in events:
+            if event.type != KEYDOWN:
+                continue
+
+            if not self.timers['tool use'].active and not self.sleep:
+                # Tool usage
+                if event.key == K_SPACE:
+                    self.timers['tool use'].activate()
+                    self.direction.x = 0
+                    self.direction.y = 0
+                    self.frame_index = 0
+
+                # Change tool
+                if event.key == K_q:
+                    self.tool_index = (self.tool_index + 1) % len(self.tools)
+                    self.selected_tool = self.tools[self.tool_index]
+
+                # Seed usage
+                if event.key == K_LCTRL:
+                    self.timers['seed use'].activate()
+                    self.direction.x = 0
+                    self.direction.y = 0
+                    self.frame_index = 0
+
+                # Change seed
+                if event.key == K_w:
+                    self.seed_index = (self.seed_index + 1) % len(self.seeds)
+                    self.selected_seed = self.seeds[self.seed_index]
+
+            if event.key == K_RETURN:
+                self.interact()
+
+    def interact(self) -> None:
+        # Only the first overlapping interactable matters, so stop at the first hit
+        collided_interaction_sprite = next((sprite for sprite in self.interactable_sprites
+                                            if sprite.rect.colliderect(self.rect)), None)
+        if collided_interaction_sprite and collided_interaction_sprite.name == 'Trader':
+            self.toggle_shop()
+        if collided_interaction_sprite and collided_interaction_sprite.name == 'Bed':
+            self.status = Status.LEFT_IDLE
+            self.direction_name = 'left'
+            self.sleep = True
 
     def set_status(self) -> None:
         # Set idle status if player isn't moving
         if self.direction.magnitude() == 0:
-            self.status = self.status.split('_')[0] + '_idle'
+            self.status = IDLE_STATUS[self.direction_name]
 
         if self.timers['tool use'].active:
-            self.status = self.status.split('_')[0] + '_' + self.selected_tool
+            self.status = TOOL_STATUS[self.selected_tool][self.direction_name]
 
     def update_timers(self) -> None:
-        for timer in self.timers.values():
+        for timer in self.all_timers:
             timer.update()
 
     def collision(self, direction: str) -> None:
-        for sprite in self.collision_sprites.sprites():
-            if hasattr(sprite, 'hitbox'):
-                if sprite.hitbox.colliderect(self.hitbox):
-                    if direction == 'horizontal':
-                        if self.direction.x > 0:  # moving right
-                            self.hitbox.right = sprite.hitbox.left
-                        if self.direction.x < 0:  # moving left
-                            self.hitbox.left = sprite.hitbox.right
-                        self.rect.centerx = self.hitbox.centerx
-                        self.pos.x = self.hitbox.centerx
-                    if direction == 'vertical':
-                        if self.direction.y > 0:  # moving down
-                            self.hitbox.bottom = sprite.hitbox.top
-                        if self.direction.y < 0:  # moving up
-                            self.hitbox.top = sprite.hitbox.bottom
-                        self.rect.centery = self.hitbox.centery
-                        self.pos.y = self.hitbox.centery
+        # Hot path: bind attributes to locals and branch on direction once, outside the sprite loop
+        hitbox = self.hitbox
+        candidates = self.collision_sprites.query(hitbox)
+        if not candidates:
+            return
+
+        if direction == 'horizontal':
+            moving_right = self.direction.x > 0
+            moving_left = self.direction.x < 0
+            for sprite in candidates:
+                sprite_hitbox = sprite.hitbox
+                if sprite_hitbox.colliderect(hitbox):
+                    if moving_right:
+                        hitbox.right = sprite_hitbox.left
+                    if moving_left:
+                        hitbox.left = sprite_hitbox.right
+                    self.rect.centerx = hitbox.centerx
+                    self.pos.x = hitbox.centerx
+        if direction == 'vertical':
+            moving_down = self.direction.y > 0
+            moving_up = self.direction.y < 0
+            for sprite in candidates:
+                sprite_hitbox = sprite.hitbox
+                if sprite_hitbox.colliderect(hitbox):
+                    if moving_down:
+                        hitbox.bottom = sprite_hitbox.top
+                    if moving_up:
+                        hitbox.top = sprite_hitbox.bottom
+                    self.rect.centery = hitbox.centery
+                    self.pos.y = hitbox.centery
 
     def move(self, dt: float) -> None:
-        # Normalize the vector
-        if self.direction.magnitude() > 0:
-            self.direction = self.direction.normalize()
-
-        # Horizontal movement
-        self.pos.x += self.direction.x * self.speed * dt
-        self.hitbox.centerx = round(self.pos.x)
-        self.rect.centerx = self.hitbox.centerx
-        self.collision('horizontal')
+        # Normalize the vector, axis-aligned movement already has a length of 1
+        dx, dy = self.direction.x, self.direction.y
+        if dx and dy:
+            inv_length = 1.0 / math.hypot(dx, dy)
+            dx *= inv_length
+            dy *= inv_length
+        distance = self.speed * dt
+
+        # Horizontal movement, nothing can change on an axis the player isn't moving along
+        if dx:
+            self.pos.x += dx * distance
+            self.hitbox.centerx = round(self.pos.x)
+            self.rect.centerx = self.hitbox.centerx
+            self.collision('horizontal')
 
         # Vertical movement
-        self.pos.y += self.direction.y * self.speed * dt
-        self.hitbox.centery = round(self.pos.y)
-        self.rect.centery = self.hitbox.centery
-        self.collision('vertical')
+        if dy:
+            self.pos.y += dy * distance
+            self.hitbox.centery = round(self.pos.y)
+            self.rect.centery = self.hitbox.centery
+            self.collision('vertical')
 
     def update(self, dt: float) -> None:
         self.input()
         self.set_status()
         self.update_timers()
-        self.set_target_pos()
 
         self.move(dt)
         self.animate(dt)
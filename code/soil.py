@@ -5,6 +5,7 @@ import pygame
 from pytmx.util_pygame import load_pygame
 
 from settings import LAYERS, TILE_SIZE, DEBUG, GROW_SPEED
+from spatial_hash import SpatialHashGroup
 from support import import_folder_dict, import_images_from_folder
 
 
@@ -61,7 +62,7 @@ class Plant(pygame.sprite.Sprite):
 
 
 class SoilLayer:
-    def __init__(self, all_sprites: pygame.sprite.Group, collision_sprites: pygame.sprite.Group):
+    def __init__(self, all_sprites: pygame.sprite.Group, collision_sprites: SpatialHashGroup):
         # Sprite Groups
         self.all_sprites = all_sprites
         self.collision_sprites = collision_sprites
@@ -168,6 +169,7 @@ class SoilLayer:
     def update_plants(self):
         for plant in self.plant_sprites.sprites():
             plant.grow()
+            self.collision_sprites.rehash(plant)
 
     def create_soil_tiles(self):
         self.soil_sprites.empty()
@@ -0,0 +1,54 @@
+import pygame
+
+from settings import TILE_SIZE
+
+
+class SpatialHashGroup(pygame.sprite.Group):
+    def __init__(self, *sprites):
+        # Hitboxes are bucketed by TILE_SIZE grid cell so collision checks only look at nearby sprites
+        self.buckets: dict[tuple[int, int], list[pygame.sprite.Sprite]] = {}
+        self.sprite_cells: dict[pygame.sprite.Sprite, list[tuple[int, int]]] = {}
+        super().__init__(*sprites)
+
+    @staticmethod
+    def cells(rect: pygame.Rect) -> list[tuple[int, int]]:
+        x0, y0 = rect.left // TILE_SIZE, rect.top // TILE_SIZE
+        x1, y1 = (rect.right - 1) // TILE_SIZE, (rect.bottom - 1) // TILE_SIZE
+        return [(x, y) for x in range(x0, x1 + 1) for y in range(y0, y1 + 1)]
+
+    def add_internal(self, sprite: pygame.sprite.Sprite, *args) -> None:
+        super().add_internal(sprite, *args)
+        self.insert(sprite)
+
+    def remove_internal(self, sprite: pygame.sprite.Sprite) -> None:
+        super().remove_internal(sprite)
+        self.discard(sprite)
+
+    def insert(self, sprite: pygame.sprite.Sprite) -> None:
+        # Sprites without a hitbox can't collide, so they stay out of the buckets until rehashed
+        if not hasattr(sprite, 'hitbox'):
+            return
+        cells = self.cells(sprite.hitbox)
+        for cell in cells:
+            self.buckets.setdefault(cell, []).append(sprite)
+        self.sprite_cells[sprite] = cells
+
+    def discard(self, sprite: pygame.sprite.Sprite) -> None:
+        for cell in self.sprite_cells.pop(sprite, ()):
+            bucket = self.buckets[cell]
+            bucket.remove(sprite)
+            if not bucket:
+                del self.buckets[cell]
+
+    def rehash(self, sprite: pygame.sprite.Sprite) -> None:
+        # Call after a member sprite's hitbox has been created, moved or resized
+        if self.has(sprite):
+            self.discard(sprite)
+            self.insert(sprite)
+
+    def query(self, rect: pygame.Rect) -> list[pygame.sprite.Sprite]:
+        candidates = {}
+        for cell in self.cells(rect):
+            for sprite in self.buckets.get(cell, ()):
+                candidates[sprite] = None
+        return list(candidates)
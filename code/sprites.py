@@ -4,17 +4,19 @@ from typing import Union, Callable
 import pygame
 
 from settings import LAYERS, APPLE_POS
+from spatial_hash import SpatialHashGroup
 from timer import Timer
 
 
 class GenericSprite(pygame.sprite.Sprite):
     def __init__(self, pos: Union[pygame.math.Vector2, tuple[int, int]], surf: pygame.Surface,
                  groups: Union[pygame.sprite.Group, list[pygame.sprite.Group], pygame.sprite.AbstractGroup], z: int):
-        super().__init__(groups)
+        # The hitbox has to exist before joining the groups, so collision groups can index it
         self.image = surf
         self.rect = self.image.get_rect(topleft=pos)
         self.z = z
         self.hitbox = self.rect.copy().inflate(-self.rect.width * 0.2, -self.rect.height * 0.75)
+        super().__init__(groups)
 
 
 class Interactable(GenericSprite):
@@ -52,8 +54,10 @@ class Water(GenericSprite):
 class WildFlower(GenericSprite):
     def __init__(self, pos: Union[pygame.math.Vector2, tuple[int, int]],
                  surf: pygame.Surface, groups: Union[pygame.sprite.Group, list[pygame.sprite.Group]]):
-        super().__init__(pos=pos, surf=surf, groups=groups, z=LAYERS['main'])
+        # Join the groups only once the final hitbox is set
+        super().__init__(pos=pos, surf=surf, groups=[], z=LAYERS['main'])
         self.hitbox = self.rect.copy().inflate((-20, -self.rect.height * 0.9))
+        self.add(groups)
 
 
 class Particle(GenericSprite):
@@ -74,9 +78,11 @@ class Particle(GenericSprite):
 
 class Tree(GenericSprite):
     def __init__(self, pos: Union[pygame.math.Vector2, tuple[int, int]], surf: pygame.Surface,
-                 groups: Union[pygame.sprite.Group, list[pygame.sprite.Group]], name: str, player_add: Callable):
+                 groups: Union[pygame.sprite.Group, list[pygame.sprite.Group]], name: str, player_add: Callable,
+                 collision_sprites: SpatialHashGroup):
         super().__init__(pos, surf, groups, LAYERS['main'])
         self.all_sprites = self.groups()[0]
+        self.collision_sprites = collision_sprites
         self.axe_sound = pygame.mixer.Sound('../audio/axe.mp3')
         self.axe_sound.set_volume(0.05)
 
@@ -115,6 +121,7 @@ class Tree(GenericSprite):
             self.image = self.stump_surf
             self.rect = self.image.get_rect(midbottom=self.rect.midbottom)
             self.hitbox = self.rect.copy().inflate(-10, -self.rect.height * 0.6)
+            self.collision_sprites.rehash(self)
             self.player_add('wood')
             self.alive = False
 
@@ -23,7 +23,3 @@ def import_folder_dict(path: str) -> dict[str: pygame.Surface]:
             image = pygame.image.load(path + '/' + filename).convert_alpha()
             res[name] = image
     return res
-
-
-def increment_and_modulo(x: int, mod: int) -> int:
-    return (x + 1) % mod
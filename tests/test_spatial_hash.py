@@ -0,0 +1,38 @@
+import pygame
+
+from spatial_hash import SpatialHashGroup
+from sprites import GenericSprite, WildFlower
+
+
+def test_generic_sprite_is_indexed_on_creation():
+    collision_sprites = SpatialHashGroup()
+    sprite = GenericSprite((64, 128), pygame.Surface((64, 64)), collision_sprites, z=0)
+
+    assert sprite in collision_sprites.query(sprite.hitbox)
+
+
+def test_wildflower_is_indexed_by_its_final_hitbox():
+    collision_sprites = SpatialHashGroup()
+    flower = WildFlower((200, 300), pygame.Surface((40, 200)), collision_sprites)
+
+    assert collision_sprites.sprite_cells[flower] == SpatialHashGroup.cells(flower.hitbox)
+    assert flower in collision_sprites.query(flower.hitbox)
+
+
+def test_removed_sprite_is_no_longer_returned():
+    collision_sprites = SpatialHashGroup()
+    sprite = GenericSprite((0, 0), pygame.Surface((64, 64)), collision_sprites, z=0)
+    sprite.kill()
+
+    assert collision_sprites.query(sprite.hitbox) == []
+    assert collision_sprites.buckets == {}
+
+
+def test_rehash_picks_up_a_moved_hitbox():
+    collision_sprites = SpatialHashGroup()
+    sprite = GenericSprite((0, 0), pygame.Surface((64, 64)), collision_sprites, z=0)
+    sprite.hitbox = pygame.Rect(640, 640, 32, 32)
+    collision_sprites.rehash(sprite)
+
+    assert collision_sprites.query(pygame.Rect(0, 0, 64, 64)) == []
+    assert sprite in collision_sprites.query(sprite.hitbox)